@@ -1,11 +1,13 @@
 import argparse
 import importlib
 import sys
-from collections.abc import Callable
-from pathlib import Path
+from collections.abc import Callable, Iterable
+from functools import lru_cache
 
 from pyrelease.utils import add_global_args, get_configured_args, read_pyrelease_config
 
+COMMANDS = ("bump", "changelog", "tag")
+
 
 def load_command_module(command_name: str):
     module_path = f"pyrelease.commands.{command_name}"
@@ -21,8 +23,8 @@ def load_command_module(command_name: str):
     return module
 
 
-def create_parser_from_files(
-    path: Path,
+def create_parser(
+    commands: Iterable[str] = COMMANDS,
 ) -> tuple[
     argparse.ArgumentParser,
     dict[str, tuple[Callable[[argparse.Namespace], None], argparse.ArgumentParser]],
@@ -35,23 +37,44 @@ def create_parser_from_files(
     sub_parser = parser.add_subparsers(dest="command")
     add_global_args(parser)
     cli_commands = {}
-    for f in path.glob("*.py"):
-        if f.is_file() and f.stem != "__init__":
-            module = load_command_module(f.stem)
-            module_parser: argparse.ArgumentParser = module.register(sub_parser)
-            module_executor: Callable[[argparse.Namespace], None] = module.execute
-            add_global_args(module_parser)
-            cli_commands[f.stem] = (module_executor, module_parser)
+    for command_name in commands:
+        module = load_command_module(command_name)
+        module_parser: argparse.ArgumentParser = module.register(sub_parser)
+        module_executor: Callable[[argparse.Namespace], None] = module.execute
+        add_global_args(module_parser)
+        cli_commands[command_name] = (module_executor, module_parser)
     parser._positionals.title = "commands"
     return parser, cli_commands
 
 
+@lru_cache(maxsize=len(COMMANDS) + 1)
+def get_parser(
+    commands: tuple[str, ...] = COMMANDS,
+) -> tuple[
+    argparse.ArgumentParser,
+    dict[str, tuple[Callable[[argparse.Namespace], None], argparse.ArgumentParser]],
+]:
+    """Get the parser for the given commands, building it once per process.
+
+    Args:
+        commands (tuple[str, ...]): Names of the commands to register
+
+    Returns:
+        tuple: The main parser and the registered commands
+    """
+    return create_parser(commands)
+
+
 def main(sys_args: list[str] | None = None):
     try:
-        commands_path = Path(__file__).parent / "commands"
-        parser, cli_commands = create_parser_from_files(commands_path)
         # sys.argv[0] is the script name, so we skip it
         sys_args = sys.argv[1:] if sys_args is None else sys_args
+        # Only import and register the requested command; help output and
+        # argument errors need the full parser.
+        if sys_args and sys_args[0] in COMMANDS:
+            parser, cli_commands = get_parser((sys_args[0],))
+        else:
+            parser, cli_commands = get_parser()
         args = parser.parse_args(sys_args)
         pyrelease_config = read_pyrelease_config(args.path)
         if args.command in cli_commands:
@@ -1,12 +1,18 @@
 import argparse
 import os
-import shutil
 import subprocess
 import warnings
 from argparse import _SubParsersAction
+from contextlib import closing
 from enum import Enum
 
-from pyrelease.utils import GitRepository, get_version_from_pyproject
+from pyrelease.utils import (
+    GitRepository,
+    clear_toml_cache,
+    get_uv_path,
+    get_version_from_pyproject,
+    lookup_conventional_commit_type,
+)
 
 
 class BumpLevel(Enum):
@@ -21,6 +27,9 @@ class BumpLevel(Enum):
     DEV = 9
 
 
+BUMP_LEVEL_RANK = {b.name.lower(): b.value for b in BumpLevel}
+
+
 def register(subparsers: _SubParsersAction):
     parser: argparse.ArgumentParser = subparsers.add_parser(
         "bump",
@@ -29,7 +38,7 @@ def register(subparsers: _SubParsersAction):
     parser.add_argument(
         "--bump",
         help="Type of version bump to apply",
-        choices=[b.name.lower() for b in BumpLevel],
+        choices=list(BUMP_LEVEL_RANK),
         required=False,
         nargs="+",
         action="append",
@@ -51,7 +60,7 @@ def register(subparsers: _SubParsersAction):
 
 
 def execute(args: argparse.Namespace):
-    if not shutil.which("uv"):
+    if not get_uv_path():
         raise RuntimeError(
             "The 'uv' command-line tool is required to run the bump command. "
             "Please install it via 'pip install uv'."
@@ -79,12 +88,15 @@ def execute(args: argparse.Namespace):
     if not args.silent:
         print(output)  # noqa: T201
     if not args.dry_run:
+        # uv rewrote pyproject.toml, so any cached version is stale
+        clear_toml_cache()
         new_version = get_version_from_pyproject(args.path)
         gh_output = os.environ.get("GITHUB_OUTPUT")
         if gh_output:
-            with open(os.environ["GITHUB_OUTPUT"], "a") as gh_output_file:
-                gh_output_file.write(f"old-version={old_version}\n")
-                gh_output_file.write(f"new-version={new_version}\n")
+            with open(gh_output, "a") as gh_output_file:
+                gh_output_file.write(
+                    f"old-version={old_version}\nnew-version={new_version}\n"
+                )
 
 
 def bump_version(bump: list[str], path: str, dry_run: bool) -> str:
@@ -109,22 +121,26 @@ def determine_bump_from_conventional_commits(
 ) -> list[list[str]] | None:
     git = GitRepository(args.path)
     tags = git.get_tags(latest=True)
-    if not tags:
-        commits = git.get_commits_since()
-    else:
-        commits = git.get_commits_since(from_ref=tags[0][0])
+    # Iterate lazily so that git log is stopped as soon as a major bump is found.
+    commits = git.iter_commits_since(from_ref=tags[0][0] if tags else None)
     bump_mapping = collect_bump_mapping(args.conventional_bump_mapping)
+    type_to_level = {
+        commit_type: level
+        for level, commit_types in bump_mapping.items()
+        for commit_type in commit_types
+    }
     highest_bump_level = None
-    for commit in commits:
-        commit_type = commit.message.split(":", 1)[0]
-        for level, types in bump_mapping.items():
-            if commit_type in types:
-                if (
-                    highest_bump_level is None
-                    or BumpLevel[level.upper()].value
-                    < BumpLevel[highest_bump_level.upper()].value
-                ):
-                    highest_bump_level = level
+    with closing(commits):
+        for commit in commits:
+            level = lookup_conventional_commit_type(commit.message, type_to_level)
+            if level is None:
+                continue
+            rank = BUMP_LEVEL_RANK[level]
+            if highest_bump_level is None or rank < BUMP_LEVEL_RANK[highest_bump_level]:
+                highest_bump_level = level
+            if rank == BumpLevel.MAJOR.value:
+                # Nothing outranks a major bump, so the remaining commits are moot.
+                break
     return [[highest_bump_level]] if highest_bump_level else None
 
 
@@ -151,7 +167,7 @@ def check_mapping_format(mapping: str):
 
 
 def check_valid_level(level: str, mapping: str):
-    if level.strip() not in [b.name.lower() for b in BumpLevel]:
+    if level.strip() not in BUMP_LEVEL_RANK:
         raise ValueError(f"Invalid bump level '{level}' in mapping '{mapping}'.")
 
 
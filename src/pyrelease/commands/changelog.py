@@ -1,12 +1,16 @@
 import argparse
 from argparse import _SubParsersAction
-from dataclasses import asdict
+from collections import defaultdict
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import fields
+from operator import attrgetter
 
 from pyrelease.utils import (
     CustomFormatter,
     GitCommit,
     GitRepository,
     get_version_from_pyproject,
+    lookup_conventional_commit_type,
 )
 
 DEFAULT_COMMIT_FORMAT = "- {message} ([{abbr_hash}]({remote_url}/commit/{abbr_hash}))"
@@ -17,6 +21,7 @@ DEFAULT_CHANGELOG_FORMAT = (
     "See all changes at: "
     "[{from_ref}..{to_ref}]({remote_url}/compare/{from_ref}..{to_ref})"
 )
+COMMIT_FORMAT_KEYS = {field.name: "" for field in fields(GitCommit)}
 
 
 def register(subparsers: _SubParsersAction):
@@ -71,34 +76,31 @@ def register(subparsers: _SubParsersAction):
 
 def execute(args: argparse.Namespace):
     git = GitRepository(args.path)
+    # Build the whole changelog first, so a failing git log never leaves a
+    # truncated output file behind.
     changelog = generate_changelog_increment(git, args.from_ref, args.to_ref, args)
     if not args.silent:
         print(changelog)  # noqa: T201
     if args.output:
-        with open(args.output, "w") as f:
+        with open(args.output, "w", encoding="utf-8", newline="\n") as f:
             f.write(changelog)
 
 
 def generate_changelog_increment(
     git: GitRepository, from_ref: str, to_ref: str, args: argparse.Namespace
-) -> None:
-    commits = git.get_commits_since(from_ref=from_ref, to_ref=to_ref)
+) -> str:
+    commits = git.iter_commits_since(from_ref=from_ref, to_ref=to_ref)
     commit_format = args.commit_format or DEFAULT_COMMIT_FORMAT
     if args.conventional:
-        type_mapping = dict(
-            item.split(":", 1)
-            for item in args.conventional_type_mapping.split(",")
-            if ":" in item
-        )
+        type_mapping = collect_type_mapping(args.conventional_type_mapping)
         changes = generate_conventional_changelog(
             commits,
             type_mapping=type_mapping,
             commit_format=commit_format,
         )
     else:
-        changes = "\n".join(
-            [format_commit(commit, commit_format) for commit in commits]
-        )
+        format_commit = create_commit_formatter(commit_format)
+        changes = "\n".join(map(format_commit, commits))
     mapping = {
         "version": get_version_from_pyproject(args.path),
         "changes": changes,
@@ -106,46 +108,110 @@ def generate_changelog_increment(
         "from_ref": from_ref,
         "to_ref": to_ref,
     }
-    changelog = format_changelog(
+    return format_changelog(
         changelog_format=args.changelog_format or DEFAULT_CHANGELOG_FORMAT,
         **mapping,
     )
-    return changelog
 
 
-def format_commit(commit: GitCommit, commit_format: str) -> str:
+def collect_type_mapping(type_mapping_str: str) -> dict[str, str]:
+    """Parse a conventional commit type mapping such as "feat:Features,fix:Fixes".
+
+    Args:
+        type_mapping_str (str): Comma-separated type:section pairs; items
+            without a colon are ignored
+
+    Returns:
+        dict[str, str]: Mapping of commit types to changelog sections
+    """
+    type_mapping = {}
+    for item in type_mapping_str.split(","):
+        if ":" not in item:
+            continue
+        commit_type, section = item.split(":", 1)
+        type_mapping[commit_type] = section
+    return type_mapping
+
+
+def create_commit_formatter(commit_format: str) -> Callable[[GitCommit], str]:
+    """Validate a commit format once and compile it into a formatting function.
+
+    The named fields are rewritten to positional indices, so each commit is
+    formatted by a single built-in str.format call over the fields fetched
+    with one attrgetter, instead of going through string.Formatter.
+
+    Args:
+        commit_format (str): Format string using GitCommit field names
+
+    Returns:
+        Callable[[GitCommit], str]: Function formatting a single commit
+    """
     formatter = CustomFormatter(commit_format)
-    mapping = asdict(commit)
-    formatter.check_format_string(mapping=mapping)
-    return formatter.format(**mapping)
+    formatter.check_format_string(mapping=COMMIT_FORMAT_KEYS)
+    fields: list[str] = []
+    parts: list[str] = []
+    for literal, field_name, spec, conversion in formatter.parse(commit_format):
+        parts.append(literal.replace("{", "{{").replace("}", "}}"))
+        if field_name is None:
+            continue
+        if spec and "{" in spec:
+            # Nested replacement fields can't be rewritten positionally, so
+            # let the built-in format_map look the fields up by name.
+            all_fields = attrgetter(*COMMIT_FORMAT_KEYS)
+            return lambda commit: commit_format.format_map(
+                dict(zip(COMMIT_FORMAT_KEYS, all_fields(commit)))
+            )
+        if field_name not in fields:
+            fields.append(field_name)
+        parts.append(
+            f"{{{fields.index(field_name)}"
+            + (f"!{conversion}" if conversion else "")
+            + (f":{spec}" if spec else "")
+            + "}"
+        )
+    # Bind the method once so the per-commit closures skip the attribute lookup.
+    format_template = "".join(parts).format
+    if not fields:
+        text = format_template()
+        return lambda commit: text
+    getter = attrgetter(*fields)
+    if len(fields) == 1:
+        return lambda commit: format_template(getter(commit))
+    return lambda commit: format_template(*getter(commit))
 
 
 def format_changelog(changelog_format: str, **kwargs) -> str:
     formatter = CustomFormatter(changelog_format)
     formatter.check_format_string(mapping=kwargs)
-    return formatter.format(**kwargs)
+    # Validated above, so the built-in formatter can take over from here.
+    return changelog_format.format_map(kwargs)
 
 
 def generate_conventional_changelog(
-    commits: list[GitCommit],
+    commits: Iterable[GitCommit],
     type_mapping: dict[str, str],
     commit_format: str,
 ) -> str:
-    other_changes = []
-    sections: dict[str, list[str]] = {section: [] for section in type_mapping.values()}
+    return "".join(iter_conventional_changelog(commits, type_mapping, commit_format))
+
+
+def iter_conventional_changelog(
+    commits: Iterable[GitCommit],
+    type_mapping: dict[str, str],
+    commit_format: str,
+) -> Iterator[str]:
+    format_commit = create_commit_formatter(commit_format)
+    # Commits without a mapped section are collected under the None key.
+    sections: defaultdict[str | None, list[str]] = defaultdict(list)
     for commit in commits:
-        commit_type = commit.message.split(":", 1)[0]
-        section = type_mapping.get(commit_type)
-        if section:
-            formatted_commit = format_commit(commit, commit_format)
-            sections[section].append(formatted_commit)
-        else:
-            formatted_commit = format_commit(commit, commit_format)
-            other_changes.append(formatted_commit)
-    changelog_sections: list[str] = []
-    for section, entries in sections.items():
-        if entries:
-            changelog_sections.append(f"### {section}\n" + "\n".join(entries))
-    if other_changes:
-        changelog_sections.append("### Other Changes\n" + "\n".join(other_changes))
-    return "\n\n".join(changelog_sections)
+        section = lookup_conventional_commit_type(commit.message, type_mapping) or None
+        sections[section].append(format_commit(commit))
+    separator = ""
+    for section in [*dict.fromkeys(type_mapping.values()), None]:
+        if section not in sections:
+            continue
+        yield f"{separator}### {section or 'Other Changes'}"
+        for entry in sections[section]:
+            yield "\n"
+            yield entry
+        separator = "\n\n"
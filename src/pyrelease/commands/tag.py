@@ -1,8 +1,11 @@
 import argparse
+import sys
 from argparse import _SubParsersAction
 
 from pyrelease.utils import CustomFormatter, GitRepository
 
+DEFAULT_MESSAGE_FORMAT = "Release v{version}"
+
 
 def register(subparsers: _SubParsersAction):
     parser: argparse.ArgumentParser = subparsers.add_parser(
@@ -26,7 +29,14 @@ def register(subparsers: _SubParsersAction):
 
 def execute(args: argparse.Namespace):
     if not args.message_format and not args.message:
-        args.message = input("Enter tag message: ")
+        if sys.stdin.isatty():
+            args.message = input("Enter tag message: ")
+        else:
+            # Take a piped message (e.g. `echo msg | pyrelease tag`) without
+            # prompting, and fall back to the default when stdin is empty.
+            args.message = sys.stdin.readline().strip() or None
+            if args.message is None:
+                args.message_format = DEFAULT_MESSAGE_FORMAT
     git = GitRepository(args.path, dry_run=args.dry_run)
     version = f"v{args.project_version}"
     formatter = CustomFormatter(args.message_format)
@@ -1,15 +1,99 @@
 from __future__ import annotations
 
 import argparse
-import json
+import copy
+import os
+import re
 import shutil
 import string
 import subprocess
-import tomllib
+import tempfile
 import warnings
+from collections.abc import Iterator
 from dataclasses import dataclass
+from functools import cached_property, lru_cache
 from pathlib import Path
 
+GIT_FIELD_SEPARATOR = "\x1f"
+# Must list the GitCommit fields (except remote_url) in declaration order.
+GIT_LOG_FIELDS = {
+    "abbr_hash": "%h",
+    "commit_hash": "%H",
+    "message": "%s",
+    "author": "%an",
+    "author_email": "%ae",
+    "date": "%aI",
+    "committer_name": "%cn",
+    "committer_email": "%ce",
+    "committer_date": "%cI",
+}
+# Each field is separated by the ASCII unit separator and each record is
+# terminated by NUL (via -z), so commit messages never need escaping.
+# See more: https://git-scm.com/docs/pretty-formats
+GIT_LOG_PRETTY_FORMAT = GIT_FIELD_SEPARATOR.join(GIT_LOG_FIELDS.values())
+GIT_LOG_CHUNK_SIZE = 64 * 1024
+# type, optional (scope) and optional breaking-change marker, e.g. "feat(api)!:"
+CONVENTIONAL_COMMIT_RE = re.compile(r"([\w-]+)(?:\([^)]*\))?(!?):")
+# Applied to every git process: untranslated messages (matched on stderr),
+# no optional index locks for read-only commands and no interactive prompts.
+GIT_ENV_OVERRIDES = {
+    "LC_ALL": "C",
+    "GIT_OPTIONAL_LOCKS": "0",
+    "GIT_TERMINAL_PROMPT": "0",
+}
+# Config for git's version sort, so pre-releases rank below their final release
+# in PEP 440 order: v1.0.dev1 < v1.0a1 < v1.0b1 < v1.0rc1 < v1.0 < v1.0.post1.
+# "-" also places SemVer pre-releases such as v1.0-rc.1 below v1.0.
+GIT_VERSIONSORT_CONFIG = tuple(
+    arg
+    for suffix in ("-", ".dev", "a", "b", "rc")
+    for arg in ("-c", f"versionsort.suffix={suffix}")
+)
+# Supported remote URL prefixes and their HTTPS replacement
+REMOTE_URL_REWRITES = (
+    ("https://", "https://"),
+    ("git@github.com:", "https://github.com/"),
+    ("http://", "https://"),
+)
+# Options shared by every command, keyed by their configuration name
+GLOBAL_OPTIONS = {
+    "project-name": {"type": str, "help": "Name of the project"},
+    "project-version": {"type": str, "help": "Version of the project"},
+    "path": {"type": Path, "default": ".", "help": "Path to the git repository"},
+    "silent": {
+        "action": "store_true",
+        "help": "Suppress output to stdout",
+        "default": False,
+    },
+    "debug": {"action": "store_true", "help": "Enable debug output", "default": False},
+    "dry-run": {
+        "action": "store_true",
+        "help": "Perform a trial run with no changes made",
+        "default": False,
+    },
+}
+
+
+def get_git_env() -> dict[str, str]:
+    """Get the environment for git processes.
+
+    Built per call so that changes to os.environ are picked up.
+
+    Returns:
+        dict[str, str]: The current environment with GIT_ENV_OVERRIDES applied
+    """
+    return {**os.environ, **GIT_ENV_OVERRIDES}
+
+
+@lru_cache(maxsize=1)
+def get_uv_path() -> str | None:
+    """Locate the 'uv' executable on PATH, caching the result for the process.
+
+    Returns:
+        str | None: Path to the 'uv' executable, or None if it is not installed
+    """
+    return shutil.which("uv")
+
 
 def create_python_project(path: Path, git=False) -> None:
     """Create a new Python project at the specified path.
@@ -18,7 +102,7 @@ def create_python_project(path: Path, git=False) -> None:
         path (Path): Path to create the Python project
         git (bool): Whether to initialize a git repository
     """
-    if not shutil.which("uv"):
+    if not get_uv_path():
         raise RuntimeError(
             "The 'uv' command-line tool is required to create a Python project. "
             "Please install it via 'pip install uv'."
@@ -47,6 +131,34 @@ def create_python_project(path: Path, git=False) -> None:
         GitRepository(path, init=True)
 
 
+def lookup_conventional_commit_type(
+    message: str, mapping: dict[str, str]
+) -> str | None:
+    """Look up the mapped value for the conventional commit type of a message.
+
+    The full prefix is tried first, so a key such as "feat(api)" or
+    "feat(api)!" only matches commits with that scope. Otherwise the scope is
+    dropped and a breaking-change marker is kept, so both "feat!: ..." and
+    "feat(api)!: ..." match the key "feat!".
+
+    Args:
+        message (str): Commit message
+        mapping (dict[str, str]): Values keyed by commit type
+
+    Returns:
+        str | None: Mapped value, or None if the message is not conventional
+            or its type is not mapped
+    """
+    match = CONVENTIONAL_COMMIT_RE.match(message)
+    if match is None:
+        return None
+    # The match ends with the ":" after the type, scope and marker.
+    scoped_type = match.group(0)[:-1]
+    if scoped_type in mapping:
+        return mapping[scoped_type]
+    return mapping.get(match.group(1) + match.group(2))
+
+
 def read_pyrelease_config(path: str) -> dict:
     """Read pyrelease configuration from pyproject.toml and .pyrelease.toml files.
 
@@ -56,23 +168,27 @@ def read_pyrelease_config(path: str) -> dict:
     Returns:
         dict: Pyrelease configuration dictionary
     """
-    pyproject_path = Path(f"{path}/pyproject.toml")
-    if not pyproject_path.exists():
-        raise FileNotFoundError(f"pyproject.toml not found in path: {path}")
-    with open(pyproject_path, "rb") as f:
-        pyproject_data = tomllib.load(f)
+    base = Path(path)
+    try:
+        pyproject_data = load_toml(base / "pyproject.toml")
+    except FileNotFoundError:
+        raise FileNotFoundError(f"pyproject.toml not found in path: {path}") from None
     project_name = pyproject_data.get("project", {}).get("name")
     project_version = pyproject_data.get("project", {}).get("version")
     if not project_name or not project_version:
         raise ValueError(
             "project.name and project.version must be defined in pyproject.toml"
         )
-    pyrelease_config = pyproject_data.get("tool", {}).get("pyrelease", {})
-    dot_pyrelease_path = Path(f"{path}/.pyrelease.toml")
-    if dot_pyrelease_path.exists():
-        with open(dot_pyrelease_path, "rb") as f:
-            dot_pyrelease_data = tomllib.load(f)
-        pyrelease_config.update(dot_pyrelease_data.get("pyrelease", {}))
+    # The parsed TOML is cached and shared, so work on a private copy.
+    pyrelease_config = copy.deepcopy(
+        pyproject_data.get("tool", {}).get("pyrelease", {})
+    )
+    try:
+        dot_pyrelease_data = load_toml(base / ".pyrelease.toml")
+    except FileNotFoundError:
+        pass
+    else:
+        pyrelease_config.update(copy.deepcopy(dot_pyrelease_data.get("pyrelease", {})))
     pyrelease_config["project-name"] = project_name
     pyrelease_config["project-version"] = project_version
     return pyrelease_config
@@ -88,15 +204,11 @@ def get_configured_args(config: dict, command_name: str) -> list[str]:
     Returns:
         list[str]: List of command-line arguments
     """
-    global_args = [
-        arg.option_strings[0]
-        for arg in add_global_args(argparse.ArgumentParser())._group_actions
-    ]
-    additional_args = config.get(command_name, {})
-    for arg in global_args:
-        arg_key = arg.lstrip("--")
-        if arg_key in config and arg_key not in additional_args:
-            additional_args[arg_key] = config[arg_key]
+    # Copy so the global defaults don't leak into the caller's config.
+    additional_args = dict(config.get(command_name, {}))
+    for arg_key in GLOBAL_OPTIONS:
+        if arg_key in config:
+            additional_args.setdefault(arg_key, config[arg_key])
     args = []
     for key, value in additional_args.items():
         arg_key = f"--{key.replace('_', '-')}"
@@ -104,12 +216,9 @@ def get_configured_args(config: dict, command_name: str) -> list[str]:
             if value:
                 args.append(arg_key)
         elif isinstance(value, list):
-            for item in value:
-                args.append(arg_key)
-                args.append(str(item))
+            args.extend(x for item in value for x in (arg_key, str(item)))
         else:
-            args.append(arg_key)
-            args.append(str(value))
+            args.extend((arg_key, str(value)))
     return args
 
 
@@ -123,43 +232,45 @@ def add_global_args(parser: argparse.ArgumentParser) -> argparse._ArgumentGroup:
         argparse._ArgumentGroup: The global arguments group
     """
     global_args = parser.add_argument_group("global options")
-    global_args.add_argument(
-        "--project-name",
-        type=str,
-        help="Name of the project",
-    )
-    global_args.add_argument(
-        "--project-version",
-        type=str,
-        help="Version of the project",
-    )
-    global_args.add_argument(
-        "--path",
-        type=Path,
-        default=".",
-        help="Path to the git repository",
-    )
-    global_args.add_argument(
-        "--silent",
-        action="store_true",
-        help="Suppress output to stdout",
-        default=False,
-    )
-    global_args.add_argument(
-        "--debug",
-        action="store_true",
-        help="Enable debug output",
-        default=False,
-    )
-    global_args.add_argument(
-        "--dry-run",
-        action="store_true",
-        help="Perform a trial run with no changes made",
-        default=False,
-    )
+    for name, kwargs in GLOBAL_OPTIONS.items():
+        global_args.add_argument(f"--{name}", **kwargs)
     return global_args
 
 
+def load_toml(path: Path) -> dict:
+    """Load a TOML file, reusing the parsed data while the file is unchanged.
+
+    The cache is keyed on the resolved path, modification time and size. The
+    returned dictionary is shared between callers and must not be modified.
+
+    Args:
+        path (Path): Path to the TOML file
+
+    Returns:
+        dict: Parsed TOML data
+    """
+    stat = path.stat()
+    return _load_toml_cached(str(path.resolve()), stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=32)
+def _load_toml_cached(path: str, mtime_ns: int, size: int) -> dict:
+    # Imported lazily: the TOML parser is only needed once a file is actually
+    # read, which library users of GitRepository never do.
+    import tomllib  # noqa: PLC0415
+
+    return tomllib.loads(Path(path).read_text(encoding="utf-8"))
+
+
+def clear_toml_cache() -> None:
+    """Drop all TOML data cached by `load_toml`.
+
+    Needed after rewriting a file within the filesystem's timestamp
+    granularity without changing its size, e.g. a version bump by 'uv'.
+    """
+    _load_toml_cached.cache_clear()
+
+
 def get_version_from_pyproject(path: Path) -> str:
     """Retrieve the version from pyproject.toml.
 
@@ -174,14 +285,23 @@ def get_version_from_pyproject(path: Path) -> str:
     pyproject_path = path / "pyproject.toml"
     if not pyproject_path.exists():
         raise FileNotFoundError(f"pyproject.toml not found in path: {path}")
-    with open(pyproject_path, "rb") as f:
-        pyproject_data = tomllib.load(f)
+    pyproject_data = load_toml(pyproject_path)
     try:
         return pyproject_data["project"]["version"]
     except KeyError:
         raise ValueError("project.version not found in pyproject.toml") from None
 
 
+@lru_cache(maxsize=256)
+def _parse_format_keys(format_string: str) -> frozenset[str]:
+    """Parse the field names out of a format string, once per distinct string."""
+    return frozenset(
+        item[1]
+        for item in string.Formatter().parse(format_string)
+        if item[1] is not None
+    )
+
+
 class CustomFormatter(string.Formatter):
     def __init__(self, string=None):
         """Custom string formatter to extract keys from format strings.
@@ -200,13 +320,13 @@ class CustomFormatter(string.Formatter):
                 If None, uses the instance's string.
 
         Returns:
-            set: Set of keys used in the format string.
+            frozenset: Set of keys used in the format string.
         """
         if format_string is None:
             if self._string is None:
                 raise ValueError("No format string provided.")
             format_string = self._string
-        return {item[1] for item in self.parse(format_string) if item[1] is not None}
+        return _parse_format_keys(format_string)
 
     def format(self, /, *args, **kwargs) -> str:
         if self._string is None:
@@ -231,14 +351,14 @@ class CustomFormatter(string.Formatter):
         if not mapping:
             raise ValueError("No mapping provided to check format string against.")
         keys = self.get_keys(format_string=format_string)
-        valid_keys = set(mapping.keys())
-        unsupported_keys = keys - valid_keys
+        # Only the cached key set is iterated; the mapping is just probed.
+        unsupported_keys = keys.difference(mapping)
         if unsupported_keys:
             err = [
                 "Found invalid keys in format string:",
                 ", ".join(f"'{key}'" for key in unsupported_keys) + ".\n",
                 "Valid keys are:",
-                ", ".join(f"'{key}'" for key in valid_keys) + ".",
+                ", ".join(f"'{key}'" for key in mapping) + ".",
             ]
             raise ValueError(" ".join(err))
 
@@ -256,6 +376,8 @@ class GitRepository:
             raise FileNotFoundError(f"Path '{path}' does not exist.")
         self.path = path
         self.dry_run = dry_run
+        # get_tags results keyed by the `latest` flag; cleared by tag()
+        self._tags: dict[bool, list[list[str]]] = {}
         if init and not self._is_git_repo():
             self.init(
                 user=init_user or "PyRelease",
@@ -271,17 +393,23 @@ class GitRepository:
         Returns:
             bool: True if the path is a git repository, False otherwise
         """
+        # A .git entry (a directory, or a file in worktrees and submodules)
+        # answers the common case without spawning git.
+        if (Path(self.path) / ".git").exists():
+            return True
         result = self._run_git_command(["rev-parse"])
         return result.returncode == 0
 
     def _run_git_command(
-        self, command: list[str], check: bool = False
+        self, command: list[str], check: bool = False, capture: bool = True
     ) -> subprocess.CompletedProcess[str]:
         """Run a git command in the repository.
 
         Args:
             command (list[str]): Git command and arguments
             check (bool): Whether to raise an exception on non-zero exit
+            capture (bool): Whether to capture stdout. When False, stdout is
+                discarded; stderr is always captured for error reporting.
 
         Returns:
             subprocess.CompletedProcess: Completed process object
@@ -289,9 +417,12 @@ class GitRepository:
         result = subprocess.run(
             ["git"] + command,
             check=check,
-            capture_output=True,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE if capture else subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
             text=True,
             cwd=self.path,
+            env=get_git_env(),
         )
         return result
 
@@ -302,9 +433,11 @@ class GitRepository:
             user (str): Git user name
             email (str): Git user email
         """
-        self._run_git_command(["init"], check=True)
-        self._run_git_command(["config", "user.name", user], check=True)
-        self._run_git_command(["config", "user.email", email], check=True)
+        self._run_git_command(["init"], check=True, capture=False)
+        self._run_git_command(["config", "user.name", user], check=True, capture=False)
+        self._run_git_command(
+            ["config", "user.email", email], check=True, capture=False
+        )
 
     def commit(self, message: str) -> str:
         """Create a new git commit in the repository.
@@ -315,8 +448,8 @@ class GitRepository:
         Returns:
             str: Created commit hash
         """
-        self._run_git_command(["add", "."], check=True)
-        self._run_git_command(["commit", "-m", message], check=True)
+        self._run_git_command(["add", "."], check=True, capture=False)
+        self._run_git_command(["commit", "-m", message], check=True, capture=False)
         result = self._run_git_command(["rev-parse", "--short", "HEAD"], check=True)
         commit_hash = result.stdout.strip()
         return commit_hash
@@ -350,38 +483,57 @@ class GitRepository:
             raise RuntimeError(
                 f"Failed to create git tag '{tag}' at '{self.path}': {err}"
             )  # pragma: no cover - dont know how to trigger this in tests
+        self._tags.clear()
 
     def get_tags(self, latest: bool = False) -> list[list[str]]:
         """Get a list of git tags in the repository.
 
+        Results are cached until a tag is created through `tag`. Each call
+        returns fresh lists, so callers may modify them without touching the
+        cache.
+
         Args:
             latest (bool): Whether to return only the latest tag
 
         Returns:
             list[list[str]]: List of git tags with their messages
         """
-        result = self._run_git_command(
-            ["tag", "-l", "--format=%(refname:short) %(contents)"]
-        )
+        if latest in self._tags:
+            return [list(tag) for tag in self._tags[latest]]
+        if latest and False in self._tags:
+            return [list(tag) for tag in self._tags[False][:1]]
+        # A single for-each-ref call lists, sorts and (optionally) limits the
+        # tags, so git never has to enumerate refs we are going to discard.
+        cmd = [
+            *GIT_VERSIONSORT_CONFIG,
+            "for-each-ref",
+            "--sort=-v:refname",
+            "--format=%(refname:short)%09%(contents:subject)",
+        ]
+        if latest:
+            cmd.append("--count=1")
+        result = self._run_git_command([*cmd, "refs/tags/"])
         if result.returncode != 0:
             raise RuntimeError(
                 f"Failed to get git tags at '{self.path}': {result.stderr.strip()}"
             )  # pragma: no cover - dont know how to trigger this in tests
-        tags = [
-            [part.strip() for part in line.split(" ", 1)]
-            for line in result.stdout.strip().splitlines()
-            if line
-        ]
-        if latest and tags:
-            return [tags[0]]
-        return tags
+        # git already trims subjects, so the tab-separated fields need no strip.
+        tags = [line.split("\t", 1) for line in result.stdout.splitlines() if line]
+        self._tags[latest] = tags
+        return [list(tag) for tag in tags]
 
     def get_remote_url(self) -> str | None:
         """Get the remote URL of the remote origin of the git repository.
 
+        The URL is looked up once and cached for the lifetime of the instance.
+
         Returns:
             str | None: GitHub URL of the remote origin or None if not set
         """
+        return self._remote_url
+
+    @cached_property
+    def _remote_url(self) -> str | None:
         result = self._run_git_command(["config", "--get", "remote.origin.url"])
         if result.returncode != 0:
             warnings.warn(
@@ -391,27 +543,14 @@ class GitRepository:
             )
             return None
 
-        remote_url = result.stdout.strip()
-        if not remote_url.startswith(
-            (
-                "https://",
-                "git@github.com:",
-                "http://",
-            )
-        ):
-            raise ValueError(
-                f"Unsupported remote URL format: '{result.stdout.strip()}'. "
-                "remote.origin.url must start with 'git@github.com:' or 'https://'.",
-            )
-
-        if remote_url.endswith(".git"):
-            remote_url = remote_url[:-4]
-        if remote_url.startswith("git@github.com:"):
-            remote_url = remote_url.replace("git@github.com:", "https://github.com/")
-        elif remote_url.startswith("http://"):
-            remote_url = remote_url.replace("http://", "https://")
-
-        return remote_url
+        remote_url = result.stdout.strip().removesuffix(".git")
+        for prefix, replacement in REMOTE_URL_REWRITES:
+            if remote_url.startswith(prefix):
+                return replacement + remote_url[len(prefix) :]
+        raise ValueError(
+            f"Unsupported remote URL format: '{result.stdout.strip()}'. "
+            "remote.origin.url must start with 'git@github.com:' or 'https://'.",
+        )
 
     def get_commits_since(
         self,
@@ -428,53 +567,93 @@ class GitRepository:
         Returns:
             list[GitCommit]: List of commits since the specified commit
         """
-        # Define the pretty format for git log output.
-        # See more: https://git-scm.com/docs/pretty-formats
-        remote_url = self.get_remote_url()
-        commit_parts = [
-            "{",
-            f'"remote_url": "{remote_url}",' if remote_url else None,
-            '"abbr_hash": "%h",',
-            '"commit_hash": "%H",',
-            '"message": "%s",',
-            '"author": "%an",',
-            '"author_email": "%ae",',
-            '"date": "%aI",',
-            '"committer_name": "%cn",',
-            '"committer_email": "%ce",',
-            '"committer_date": "%cI"',
-            "}",
-        ]
-        commit_parts = [part for part in commit_parts if part is not None]
-        pretty_format = "".join(commit_parts)
+        return list(self.iter_commits_since(from_ref, to_ref))
+
+    def iter_commits_since(
+        self,
+        from_ref: str | None = None,
+        to_ref: str = "HEAD",
+    ) -> Iterator[GitCommit]:
+        """Iterate over commits since a specific commit as git produces them.
+
+        The output of git log is read incrementally, so the full log is never
+        held in memory at once. Closing the iterator early stops git.
+
+        Args:
+            from_ref (str | None): Commit hash to get commits since,
+                defaults to None (all commits)
+            to_ref (str): Commit hash to get commits to, defaults to HEAD
+
+        Yields:
+            GitCommit: Commits since the specified commit, newest first
+
+        Raises:
+            RuntimeError: If git log fails
+        """
         between = "" if not from_ref else f"{from_ref}..{to_ref}"
+        cmd = ["git", "log", "-z"]
+        cmd.append(f"--pretty=format:{GIT_LOG_PRETTY_FORMAT}")
         if from_ref:
-            cmd = ["git", "log", between, f"--pretty=format:{pretty_format}"]
-        else:
-            cmd = ["git", "log", f"--pretty=format:{pretty_format}"]
-        result = subprocess.run(
-            cmd,
-            check=False,
-            capture_output=True,
-            text=True,
-            cwd=self.path,
-        )
-        if result.returncode != 0:
+            cmd.append(between)
+        # stderr goes to a file rather than a pipe: it is only read once stdout
+        # is exhausted, and git would block on a full stderr pipe before that.
+        with (
+            tempfile.TemporaryFile() as stderr_file,
+            subprocess.Popen(
+                cmd,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
+                stderr=stderr_file,
+                cwd=self.path,
+                env=get_git_env(),
+            ) as process,
+        ):
+            assert process.stdout is not None
+            try:
+                # Resolve the remote while git log is already walking the
+                # history, so the two git processes run concurrently.
+                remote_url = self.get_remote_url() or ""
+                # Split the raw bytes and decode record by record, which skips
+                # the TextIOWrapper layer and tolerates non UTF-8 messages.
+                pending = b""
+                while chunk := process.stdout.read(GIT_LOG_CHUNK_SIZE):
+                    *records, pending = (pending + chunk).split(b"\x00")
+                    for record in records:
+                        yield _parse_commit_record(record, remote_url)
+                # format: (rather than tformat:) leaves the last record
+                # unterminated.
+                if pending:
+                    yield _parse_commit_record(pending, remote_url)
+            except BaseException:
+                # Closed early or failed: don't wait for git to finish the log.
+                process.kill()
+                raise
+            process.wait()
+            stderr_file.seek(0)
+            stderr = stderr_file.read().decode(errors="replace")
+        if process.returncode != 0:
             raise RuntimeError(
-                f"Failed to get git commits for range '{between}': "
-                f"{result.stderr.strip()}"
+                f"Failed to get git commits for range '{between}': {stderr.strip()}"
             )
-        commit_strings = [
-            line for line in result.stdout.strip().split("\n") if line.strip()
-        ]
-        commits = []
-        for commit in commit_strings:
-            git_commit = GitCommit(**json.loads(commit.strip()))
-            commits.append(git_commit)
-        return commits
 
 
-@dataclass
+def _parse_commit_record(record: bytes, remote_url: str) -> GitCommit:
+    """Build a GitCommit from a single GIT_LOG_FIELDS formatted git log record.
+
+    Args:
+        record (bytes): Record with fields separated by GIT_FIELD_SEPARATOR
+        remote_url (str): Remote URL to attach to the commit
+
+    Returns:
+        GitCommit: Parsed commit
+    """
+    values = record.decode(errors="replace").split(GIT_FIELD_SEPARATOR)
+    # GIT_LOG_FIELDS follows the GitCommit field order after remote_url, so the
+    # values can be passed positionally instead of through a kwargs dict.
+    return GitCommit(remote_url, *values)
+
+
+@dataclass(slots=True)
 class GitCommit:
     remote_url: str = ""
     abbr_hash: str = ""
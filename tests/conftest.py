@@ -0,0 +1,84 @@
+import os
+import shutil
+import subprocess
+
+import pytest
+
+from pyrelease.utils import GitRepository, create_python_project
+
+# Test repositories are throwaway: skip durability, housekeeping and signing.
+TEMPLATE_GIT_CONFIG = {
+    "core.fsync": "none",
+    "gc.auto": "0",
+    "commit.gpgsign": "false",
+    "tag.gpgsign": "false",
+}
+
+
+# Tests requesting these fixtures work on real projects and spawn uv or git.
+SLOW_FIXTURES = {"git_repository", "python_project", "tmp_path_factory"}
+
+
+def pytest_collection_modifyitems(items):
+    for item in items:
+        if SLOW_FIXTURES.intersection(item.fixturenames):
+            item.add_marker(pytest.mark.slow)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def isolated_git_config():
+    """Keep the developer's global and system git config out of the tests."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("GIT_CONFIG_GLOBAL", os.devnull)
+        mp.setenv("GIT_CONFIG_NOSYSTEM", "1")
+        mp.setenv("GIT_TERMINAL_PROMPT", "0")
+        yield
+
+
+@pytest.fixture(scope="session")
+def git_repository_template(tmp_path_factory):
+    """Empty git repository, initialised once per test session."""
+    path = tmp_path_factory.mktemp("git-repository-template")
+    git = GitRepository(path, init=True)
+    for key, value in TEMPLATE_GIT_CONFIG.items():
+        git._run_git_command(["config", key, value], check=True, capture=False)
+    return path
+
+
+@pytest.fixture
+def git_repository(tmp_path, git_repository_template):
+    """Private copy of the empty template repository for a single test."""
+    shutil.copytree(git_repository_template, tmp_path, dirs_exist_ok=True)
+    return tmp_path
+
+
+@pytest.fixture(scope="session")
+def python_project_template(tmp_path_factory):
+    """Python project with a git repository, created once per test session."""
+    path = tmp_path_factory.mktemp("python-project-template")
+    create_python_project(path, git=True)
+    git = GitRepository(path)
+    for key, value in TEMPLATE_GIT_CONFIG.items():
+        git._run_git_command(["config", key, value], check=True, capture=False)
+    return path
+
+
+@pytest.fixture
+def python_project(tmp_path, python_project_template):
+    """Private copy of the template project for a single test."""
+    shutil.copytree(python_project_template, tmp_path, dirs_exist_ok=True)
+    return tmp_path
+
+
+@pytest.fixture
+def git_commands(monkeypatch):
+    """Record the arguments of every process spawned during a test."""
+    commands = []
+
+    class RecordingPopen(subprocess.Popen):
+        def __init__(self, args, *popen_args, **kwargs):
+            commands.append(list(args))
+            super().__init__(args, *popen_args, **kwargs)
+
+    monkeypatch.setattr(subprocess, "Popen", RecordingPopen)
+    return commands
@@ -4,7 +4,6 @@ from pyrelease import main
 from pyrelease.commands.bump import collect_bump_mapping
 from pyrelease.utils import (
     GitRepository,
-    create_python_project,
     get_version_from_pyproject,
 )
 
@@ -63,6 +62,11 @@ def test_bump_mapping_str_invalid_level():
         collect_bump_mapping(bump_mapping_str)
 
 
+def test_bump_mapping_str_scoped_type():
+    result = collect_bump_mapping("feat(api):major,fix:patch")
+    assert result == {"major": ["feat(api)"], "patch": ["fix"]}
+
+
 def test_bump_mapping_str_with_extra_commas():
     bump_mapping_str = "feat:minor,,fix:patch,,docs:patch,"
     expected_mapping = {
@@ -102,9 +106,7 @@ def test_bump_command_fails():
 
 
 def test_bump_command_uv_missing(monkeypatch):
-    monkeypatch.setattr(
-        "shutil.which", lambda cmd: None if cmd == "uv" else "/usr/bin/uv"
-    )
+    monkeypatch.setattr("pyrelease.commands.bump.get_uv_path", lambda: None)
     with pytest.raises(
         RuntimeError,
         match="The 'uv' command-line tool is required to run the bump command.",
@@ -112,9 +114,8 @@ def test_bump_command_uv_missing(monkeypatch):
         main(["bump", "--bump", "minor", "--dry-run"])
 
 
-def test_bump_manual(tmp_path_factory):
-    repo_path = tmp_path_factory.mktemp("repo_manual_bump")
-    create_python_project(repo_path, git=True)
+def test_bump_manual(python_project):
+    repo_path = python_project
     old_version = get_version_from_pyproject(repo_path)
     main(
         [
@@ -129,9 +130,8 @@ def test_bump_manual(tmp_path_factory):
     assert old_version != new_version
 
 
-def test_bump_manual_invalid_level(tmp_path_factory):
-    repo_path = tmp_path_factory.mktemp("repo_manual_bump_invalid")
-    create_python_project(repo_path, git=True)
+def test_bump_manual_invalid_level(python_project):
+    repo_path = python_project
     with pytest.raises(SystemExit) as exc_info:
         main(
             [
@@ -146,9 +146,8 @@ def test_bump_manual_invalid_level(tmp_path_factory):
         assert "invalid choice: 'invalid'" in str(exc_info.value)
 
 
-def test_bump_manual_github_actions_output(tmp_path_factory, monkeypatch):
-    repo_path = tmp_path_factory.mktemp("repo_manual_bump_github")
-    create_python_project(repo_path, git=True)
+def test_bump_manual_github_actions_output(python_project, monkeypatch):
+    repo_path = python_project
     old_version = get_version_from_pyproject(repo_path)
     gh_output_file = repo_path / "gh_output.txt"
     monkeypatch.setenv("GITHUB_OUTPUT", str(gh_output_file))
@@ -163,15 +162,13 @@ def test_bump_manual_github_actions_output(tmp_path_factory, monkeypatch):
     )
     new_version = get_version_from_pyproject(repo_path)
     assert old_version != new_version
-    with open(gh_output_file) as f:
-        gh_output_content = f.read()
+    gh_output_content = gh_output_file.read_text(encoding="utf-8")
     assert f"old-version={old_version}" in gh_output_content
     assert f"new-version={new_version}" in gh_output_content
 
 
-def test_bump_manual_dry_run(tmp_path_factory):
-    repo_path = tmp_path_factory.mktemp("repo_manual_bump_dry_run")
-    create_python_project(repo_path, git=True)
+def test_bump_manual_dry_run(python_project):
+    repo_path = python_project
     old_version = get_version_from_pyproject(repo_path)
     main(
         [
@@ -187,9 +184,8 @@ def test_bump_manual_dry_run(tmp_path_factory):
     assert old_version == new_version
 
 
-def test_bump_manual_multiple_release_components(tmp_path_factory):
-    repo_path = tmp_path_factory.mktemp("repo_manual_bump_multiple_levels")
-    create_python_project(repo_path, git=True)
+def test_bump_manual_multiple_release_components(python_project):
+    repo_path = python_project
     with pytest.raises(RuntimeError, match="Only one release version component"):
         main(
             [
@@ -204,9 +200,8 @@ def test_bump_manual_multiple_release_components(tmp_path_factory):
         )
 
 
-def test_bump_manual_no_release_components(tmp_path_factory):
-    repo_path = tmp_path_factory.mktemp("repo_manual_bump_no_levels")
-    create_python_project(repo_path, git=True)
+def test_bump_manual_no_release_components(python_project):
+    repo_path = python_project
     with pytest.raises(
         RuntimeError, match="you also need to increase a release version component"
     ):
@@ -221,9 +216,8 @@ def test_bump_manual_no_release_components(tmp_path_factory):
         )
 
 
-def test_bump_manual_additional_component(tmp_path_factory):
-    repo_path = tmp_path_factory.mktemp("repo_manual_bump_no_levels")
-    create_python_project(repo_path, git=True)
+def test_bump_manual_additional_component(python_project):
+    repo_path = python_project
     old_version = get_version_from_pyproject(repo_path)
     main(
         [
@@ -243,9 +237,8 @@ def test_bump_manual_additional_component(tmp_path_factory):
     assert_version_bump(old_version, new_version_main, "minor")
 
 
-def test_bump_conventional_no_valid_commits(tmp_path_factory):
-    repo_path = tmp_path_factory.mktemp("repo_no_commits")
-    create_python_project(repo_path, git=True)
+def test_bump_conventional_no_valid_commits(python_project):
+    repo_path = python_project
     with pytest.raises(RuntimeError, match="does not have any commits yet"):
         main(
             [
@@ -260,9 +253,8 @@ def test_bump_conventional_no_valid_commits(tmp_path_factory):
         )
 
 
-def test_bump_conventional(tmp_path_factory):
-    repo_path = tmp_path_factory.mktemp("repo_conventional_bump")
-    create_python_project(repo_path, git=True)
+def test_bump_conventional(python_project):
+    repo_path = python_project
     git = GitRepository(repo_path)
     # Create some conventional commits
     git.commit("feat: add new feature")
@@ -284,9 +276,51 @@ def test_bump_conventional(tmp_path_factory):
     assert_version_bump(old_version, new_version, "minor")
 
 
-def test_bump_conventional_additional_component(tmp_path_factory):
-    repo_path = tmp_path_factory.mktemp("repo_conventional_bump_additional")
-    create_python_project(repo_path, git=True)
+def test_bump_conventional_major(python_project):
+    repo_path = python_project
+    git = GitRepository(repo_path)
+    # The breaking change is the newest commit, so it is seen first
+    git.commit("fix: fix a bug")
+    (repo_path / "file.txt").write_text("Some content")
+    git.commit("feat!: breaking change")
+    old_version = get_version_from_pyproject(repo_path)
+    main(
+        [
+            "bump",
+            "--conventional",
+            "--conventional-bump-mapping",
+            "feat!:major,feat:minor,fix:patch",
+            "--path",
+            str(repo_path),
+        ]
+    )
+    new_version = get_version_from_pyproject(repo_path)
+    assert_version_bump(old_version, new_version, "major")
+
+
+def test_bump_conventional_scoped_mapping(python_project):
+    repo_path = python_project
+    git = GitRepository(repo_path)
+    git.commit("feat(api): add endpoint")
+    (repo_path / "file.txt").write_text("Some content")
+    git.commit("feat(ui): add button")
+    old_version = get_version_from_pyproject(repo_path)
+    main(
+        [
+            "bump",
+            "--conventional",
+            "--conventional-bump-mapping",
+            "feat(api):major,feat:minor",
+            "--path",
+            str(repo_path),
+        ]
+    )
+    new_version = get_version_from_pyproject(repo_path)
+    assert_version_bump(old_version, new_version, "major")
+
+
+def test_bump_conventional_additional_component(python_project):
+    repo_path = python_project
     git = GitRepository(repo_path)
     # Create some conventional commits
     git.commit("feat: add new feature")
@@ -312,9 +346,8 @@ def test_bump_conventional_additional_component(tmp_path_factory):
     assert_version_bump(old_version, new_version_main, "minor")
 
 
-def test_bump_conventional_dry_run(tmp_path_factory):
-    repo_path = tmp_path_factory.mktemp("repo_conventional_bump_dry_run")
-    create_python_project(repo_path, git=True)
+def test_bump_conventional_dry_run(python_project):
+    repo_path = python_project
     git = GitRepository(repo_path)
     # Create some conventional commits
     git.commit("feat: add new feature")
@@ -336,9 +369,8 @@ def test_bump_conventional_dry_run(tmp_path_factory):
     assert old_version == new_version
 
 
-def test_bump_conventional_custom_mapping(tmp_path_factory):
-    repo_path = tmp_path_factory.mktemp("repo_conventional_bump_custom_mapping")
-    create_python_project(repo_path, git=True)
+def test_bump_conventional_custom_mapping(python_project):
+    repo_path = python_project
     git = GitRepository(repo_path)
     # Create some conventional commits
     git.commit("chore: update dependencies")
@@ -360,9 +392,8 @@ def test_bump_conventional_custom_mapping(tmp_path_factory):
     assert_version_bump(old_version, new_version, "minor")
 
 
-def test_bump_conventional_no_conventional_commits(tmp_path_factory):
-    repo_path = tmp_path_factory.mktemp("repo_no_conventional_commits")
-    create_python_project(repo_path, git=True)
+def test_bump_conventional_no_conventional_commits(python_project):
+    repo_path = python_project
     git = GitRepository(repo_path)
     # Create some non-conventional commits
     git.commit("Initial commit")
@@ -385,9 +416,8 @@ def test_bump_conventional_no_conventional_commits(tmp_path_factory):
         )
 
 
-def test_bump_conventional_no_tags(tmp_path_factory):
-    repo_path = tmp_path_factory.mktemp("repo_conventional_bump_no_tags")
-    create_python_project(repo_path, git=True)
+def test_bump_conventional_no_tags(python_project):
+    repo_path = python_project
     git = GitRepository(repo_path)
     # Create some conventional commits
     git.commit("feat: add new feature")
@@ -409,9 +439,8 @@ def test_bump_conventional_no_tags(tmp_path_factory):
     assert_version_bump(old_version, new_version, "minor")
 
 
-def test_bump_conventional_multiple_tags(tmp_path_factory):
-    repo_path = tmp_path_factory.mktemp("repo_conventional_bump_multiple_tags")
-    create_python_project(repo_path, git=True)
+def test_bump_conventional_multiple_tags(python_project):
+    repo_path = python_project
     git = GitRepository(repo_path)
     # Create some conventional commits and tags
     git.commit("feat: add new feature")
@@ -437,9 +466,8 @@ def test_bump_conventional_multiple_tags(tmp_path_factory):
     assert_version_bump(old_version, new_version, "patch")
 
 
-def test_bump_conventional_no_commits_since_tag(tmp_path_factory):
-    repo_path = tmp_path_factory.mktemp("repo_conventional_bump_no_commits_since_tag")
-    create_python_project(repo_path, git=True)
+def test_bump_conventional_no_commits_since_tag(python_project):
+    repo_path = python_project
     git = GitRepository(repo_path)
     # Create some conventional commits and a tag
     git.commit("feat: add new feature")
@@ -1,14 +1,25 @@
+import argparse
+
+import pytest
+
 from pyrelease import main
+from pyrelease.commands.changelog import (
+    DEFAULT_CHANGELOG_FORMAT,
+    DEFAULT_COMMIT_FORMAT,
+    collect_type_mapping,
+    create_commit_formatter,
+    generate_changelog_increment,
+    generate_conventional_changelog,
+)
 from pyrelease.utils import (
+    GitCommit,
     GitRepository,
-    create_python_project,
     get_version_from_pyproject,
 )
 
 
-def test_changelog(tmp_path_factory, capsys):
-    path = tmp_path_factory.mktemp("repo")
-    create_python_project(path, git=True)
+def test_changelog(python_project, capsys):
+    path = python_project
     git = GitRepository(path)
     commit_hash = git.commit("feat: add new feature")
     main(
@@ -30,9 +41,23 @@ See all changes at: [..HEAD](/compare/..HEAD)
     assert changelog.strip() == expected_changelog.strip()
 
 
-def test_changelog_other_commit_format(tmp_path_factory, capsys):
-    path = tmp_path_factory.mktemp("repo")
-    create_python_project(path, git=True)
+@pytest.mark.parametrize("extra_args", [[], ["--conventional"]])
+def test_changelog_single_git_log(python_project, git_commands, capsys, extra_args):
+    path = python_project
+    git = GitRepository(path)
+    git.commit("feat: add new feature")
+    (path / "some_fix.txt").write_text("Some changes")
+    git.commit("fix: fix a bug")
+    git_commands.clear()
+    main(["changelog", *extra_args, "--path", str(path)])
+    assert "fix a bug" in capsys.readouterr().out
+    # One streamed git log for every commit, plus the remote URL lookup
+    assert sum("log" in command for command in git_commands) == 1
+    assert len(git_commands) == 2
+
+
+def test_changelog_other_commit_format(python_project, capsys):
+    path = python_project
     git = GitRepository(path)
     commit_hash = git.commit("feat: add new feature")
     main(
@@ -56,9 +81,8 @@ See all changes at: [..HEAD](/compare/..HEAD)
     assert changelog.strip() == expected_changelog.strip()
 
 
-def test_changelog_other_changelog_format(tmp_path_factory, capsys):
-    path = tmp_path_factory.mktemp("repo")
-    create_python_project(path, git=True)
+def test_changelog_other_changelog_format(python_project, capsys):
+    path = python_project
     git = GitRepository(path)
     commit_hash = git.commit("feat: add new feature")
     changelog_format = """
@@ -85,9 +109,27 @@ def test_changelog_other_changelog_format(tmp_path_factory, capsys):
     assert changelog.strip() == expected_changelog.strip()
 
 
-def test_changelog_new_version(tmp_path_factory, capsys):
-    path = tmp_path_factory.mktemp("repo")
-    create_python_project(path, git=True)
+def test_changelog_changes_used_twice(python_project, capsys):
+    path = python_project
+    git = GitRepository(path)
+    commit_hash = git.commit("feat: add new feature")
+    main(
+        [
+            "changelog",
+            "--path",
+            str(path),
+            "--commit-format",
+            "{abbr_hash}",
+            "--changelog-format",
+            "{changes}|{changes!r}",
+        ]
+    )
+    captured = capsys.readouterr()
+    assert captured.out.strip() == f"{commit_hash}|'{commit_hash}'"
+
+
+def test_changelog_new_version(python_project, capsys):
+    path = python_project
     git = GitRepository(path)
     commit_hash = git.commit("feat: add new feature")
     old_version = get_version_from_pyproject(path)
@@ -143,9 +185,8 @@ See all changes at: [..HEAD](/compare/..HEAD)
     assert captured.out.strip() == new_changelog.strip()
 
 
-def test_changelog_multiple(tmp_path_factory, capsys):
-    path = tmp_path_factory.mktemp("repo")
-    create_python_project(path, git=True)
+def test_changelog_multiple(python_project, capsys):
+    path = python_project
     git = GitRepository(path)
     feat_hash = git.commit("feat: add new feature")
     (path / "some_fix.txt").write_text("Some changes")
@@ -173,9 +214,8 @@ See all changes at: [..HEAD](/compare/..HEAD)
     assert changelog.strip() == expected_changelog.strip()
 
 
-def test_changelog_output(tmp_path_factory, capsys):
-    path = tmp_path_factory.mktemp("repo")
-    create_python_project(path, git=True)
+def test_changelog_output(python_project, capsys):
+    path = python_project
     git = GitRepository(path)
     commit_hash = git.commit("feat: add new feature")
     main(
@@ -197,14 +237,12 @@ def test_changelog_output(tmp_path_factory, capsys):
 See all changes at: [..HEAD](/compare/..HEAD)
 """
     assert changelog.strip() == expected_changelog.strip()
-    with open(path / "CHANGELOG.md") as f:
-        file_changelog = f.read()
+    file_changelog = (path / "CHANGELOG.md").read_text(encoding="utf-8")
     assert file_changelog.strip() == expected_changelog.strip()
 
 
-def test_changelog_conventional(tmp_path_factory, capsys):
-    path = tmp_path_factory.mktemp("repo")
-    create_python_project(path, git=True)
+def test_changelog_conventional(python_project, capsys):
+    path = python_project
     git = GitRepository(path)
     commit_hash = git.commit("feat: add new feature")
     main(
@@ -230,9 +268,8 @@ See all changes at: [..HEAD](/compare/..HEAD)
     assert changelog.strip() == expected_changelog.strip()
 
 
-def test_changelog_conventional_output(tmp_path_factory, capsys):
-    path = tmp_path_factory.mktemp("repo")
-    create_python_project(path, git=True)
+def test_changelog_conventional_output(python_project, capsys):
+    path = python_project
     git = GitRepository(path)
     commit_hash = git.commit("feat: add new feature")
     main(
@@ -258,14 +295,12 @@ def test_changelog_conventional_output(tmp_path_factory, capsys):
 See all changes at: [..HEAD](/compare/..HEAD)
 """
     assert changelog.strip() == expected_changelog.strip()
-    with open(path / "CHANGELOG.md") as f:
-        file_changelog = f.read()
+    file_changelog = (path / "CHANGELOG.md").read_text(encoding="utf-8")
     assert file_changelog.strip() == expected_changelog.strip()
 
 
-def test_changelog_conventional_multiple_sections(tmp_path_factory, capsys):
-    path = tmp_path_factory.mktemp("repo")
-    create_python_project(path, git=True)
+def test_changelog_conventional_multiple_sections(python_project, capsys):
+    path = python_project
     git = GitRepository(path)
     feat_hash = git.commit("feat: add new feature")
     (path / "some_fix.txt").write_text("Some changes")
@@ -301,9 +336,8 @@ See all changes at: [..HEAD](/compare/..HEAD)
     assert changelog.strip() == expected_changelog.strip()
 
 
-def test_changelog_conventional_other_changes(tmp_path_factory, capsys):
-    path = tmp_path_factory.mktemp("repo")
-    create_python_project(path, git=True)
+def test_changelog_conventional_other_changes(python_project, capsys):
+    path = python_project
     git = GitRepository(path)
     feat_hash = git.commit("feat: add new feature")
     (path / "some_file.txt").write_text("Some changes")
@@ -332,3 +366,124 @@ def test_changelog_conventional_other_changes(tmp_path_factory, capsys):
 See all changes at: [..HEAD](/compare/..HEAD)
 """
     assert changelog.strip() == expected_changelog.strip()
+
+
+def test_changelog_invalid_commit_format(python_project):
+    path = python_project
+    git = GitRepository(path)
+    git.commit("feat: add new feature")
+    with pytest.raises(ValueError, match="Found invalid keys in format string"):
+        main(
+            [
+                "changelog",
+                "--path",
+                str(path),
+                "--commit-format",
+                "* {message} - {unknown}",
+            ]
+        )
+
+
+def test_changelog_output_kept_on_git_failure(python_project, monkeypatch):
+    path = python_project
+    git = GitRepository(path)
+    git.commit("feat: add new feature")
+    output = path / "CHANGELOG.md"
+    output.write_text("# Old changelog\n", encoding="utf-8")
+    iter_commits_since = GitRepository.iter_commits_since
+
+    def failing_iter_commits_since(self, *args, **kwargs):
+        yield from iter_commits_since(self, *args, **kwargs)
+        raise RuntimeError("Failed to get git commits")
+
+    monkeypatch.setattr(GitRepository, "iter_commits_since", failing_iter_commits_since)
+    with pytest.raises(RuntimeError, match="Failed to get git commits"):
+        main(["changelog", "--path", str(path), "--output", str(output)])
+    assert output.read_text(encoding="utf-8") == "# Old changelog\n"
+
+
+@pytest.mark.parametrize(
+    "commit_format, expected",
+    [
+        ("- {message} ({abbr_hash})", "- feat: add {x} (abc1234)"),
+        ("{abbr_hash}/{abbr_hash}", "abc1234/abc1234"),
+        ("{message!r}", "'feat: add {x}'"),
+        ("{author:>6}|", "  jane|"),
+        ("{{literal}} {author}", "{literal} jane"),
+        ("no fields", "no fields"),
+        ("{author:>{date}}", "  jane"),
+    ],
+)
+def test_create_commit_formatter(commit_format, expected):
+    commit = GitCommit(
+        abbr_hash="abc1234", message="feat: add {x}", author="jane", date="6"
+    )
+    assert create_commit_formatter(commit_format)(commit) == expected
+
+
+def test_generate_changelog_increment(python_project):
+    path = python_project
+    git = GitRepository(path)
+    commit_hash = git.commit("feat: add new feature")
+    args = argparse.Namespace(
+        path=path,
+        commit_format=DEFAULT_COMMIT_FORMAT,
+        changelog_format=DEFAULT_CHANGELOG_FORMAT,
+        conventional=False,
+        conventional_type_mapping="",
+    )
+    changelog = generate_changelog_increment(git, "", "HEAD", args)
+    assert changelog == (
+        "# 0.1.0\n"
+        "=========================\n"
+        f"- feat: add new feature ([{commit_hash}](/commit/{commit_hash}))\n\n"
+        "See all changes at: [..HEAD](/compare/..HEAD)"
+    )
+
+
+def test_generate_conventional_changelog():
+    commits = [
+        GitCommit(message="fix: a bug"),
+        GitCommit(message="feat: a feature"),
+        GitCommit(message="chore: tidy up"),
+    ]
+    changelog = generate_conventional_changelog(
+        commits,
+        type_mapping={"feat": "Features", "fix": "Bug Fixes"},
+        commit_format="- {message}",
+    )
+    assert changelog == (
+        "### Features\n- feat: a feature\n\n"
+        "### Bug Fixes\n- fix: a bug\n\n"
+        "### Other Changes\n- chore: tidy up"
+    )
+
+
+def test_collect_type_mapping():
+    assert collect_type_mapping("feat:Features,fix:Bug Fixes,,invalid") == {
+        "feat": "Features",
+        "fix": "Bug Fixes",
+    }
+
+
+def test_collect_type_mapping_scoped_type():
+    assert collect_type_mapping("feat(api):API Changes,feat:Features") == {
+        "feat(api)": "API Changes",
+        "feat": "Features",
+    }
+
+
+def test_generate_conventional_changelog_scoped_type():
+    commits = [
+        GitCommit(message="feat(api): add endpoint"),
+        GitCommit(message="feat(ui): add button"),
+    ]
+    changelog = generate_conventional_changelog(
+        commits,
+        type_mapping={"feat(api)": "API Changes", "feat": "Features"},
+        commit_format="- {message}",
+    )
+    assert changelog == (
+        "### API Changes\n- feat(api): add endpoint\n\n"
+        "### Features\n- feat(ui): add button"
+    )
@@ -1,21 +1,45 @@
-import sys
+import io
 
 import pytest
 
 from pyrelease import main
-from pyrelease.utils import GitRepository, create_python_project
+from pyrelease.utils import GitRepository
 
 
-@pytest.mark.skipif(
-    "-s" in sys.argv or "--capture" in sys.argv,
-    reason="Cannot test stdin input when output is captured",
-)
-def test_tag_invalid():
-    with pytest.raises(OSError, match="reading from stdin while output is captured"):
-        main(["tag"])
+def test_tag_non_interactive_default_message(python_project, monkeypatch):
+    monkeypatch.setattr("sys.stdin", io.StringIO())
+    path = python_project
+    git = GitRepository(path)
+    git.commit("feat: add new feature")
+    main(["tag", "--path", str(path)])
+    git = GitRepository(path)
+    assert git.get_tags() == [["v0.1.0", "Release v0.1.0"]]
+
+
+def test_tag_non_interactive_piped_message(python_project, monkeypatch):
+    monkeypatch.setattr("sys.stdin", io.StringIO("Piped tag message\n"))
+    path = python_project
+    git = GitRepository(path)
+    git.commit("feat: add new feature")
+    main(["tag", "--path", str(path)])
+    git = GitRepository(path)
+    assert git.get_tags() == [["v0.1.0", "Piped tag message"]]
+
+
+def test_tag_non_interactive_blank_line(python_project, monkeypatch):
+    monkeypatch.setattr("sys.stdin", io.StringIO("\n"))
+    path = python_project
+    git = GitRepository(path)
+    git.commit("feat: add new feature")
+    main(["tag", "--path", str(path)])
+    git = GitRepository(path)
+    assert git.get_tags() == [["v0.1.0", "Release v0.1.0"]]
 
 
 def test_tag_with_input(monkeypatch):
+    stdin = io.StringIO()
+    monkeypatch.setattr(stdin, "isatty", lambda: True)
+    monkeypatch.setattr("sys.stdin", stdin)
     monkeypatch.setattr("builtins.input", lambda _: "Test tag message")
     try:
         main(["tag", "--dry-run"])
@@ -23,9 +47,8 @@ def test_tag_with_input(monkeypatch):
         assert e.code == 0
 
 
-def test_tag_with_message(tmp_path_factory):
-    path = tmp_path_factory.mktemp("repo")
-    create_python_project(path, git=True)
+def test_tag_with_message(python_project):
+    path = python_project
     git = GitRepository(path)
     git.commit("feat: add new feature")
     main(["tag", "--message", "Direct tag message", "--path", str(path)])
@@ -35,9 +58,8 @@ def test_tag_with_message(tmp_path_factory):
     assert message == "Direct tag message"
 
 
-def test_tag_with_message_format(tmp_path_factory):
-    path = tmp_path_factory.mktemp("repo")
-    create_python_project(path, git=True)
+def test_tag_with_message_format(python_project):
+    path = python_project
     git = GitRepository(path)
     git.commit("feat: add new feature")
     main(
@@ -55,9 +77,8 @@ def test_tag_with_message_format(tmp_path_factory):
     assert message == "Release v0.1.0"
 
 
-def test_tag_with_invalid_message_format(tmp_path_factory):
-    path = tmp_path_factory.mktemp("repo")
-    create_python_project(path, git=True)
+def test_tag_with_invalid_message_format(python_project):
+    path = python_project
     git = GitRepository(path)
     git.commit("feat: add new feature")
     with pytest.raises(
@@ -75,9 +96,8 @@ def test_tag_with_invalid_message_format(tmp_path_factory):
         )
 
 
-def test_tag_dry_run(tmp_path_factory):
-    path = tmp_path_factory.mktemp("repo")
-    create_python_project(path, git=True)
+def test_tag_dry_run(python_project):
+    path = python_project
     git = GitRepository(path)
     git.commit("feat: add new feature")
     main(["tag", "--message", "My message", "--dry-run", "--path", str(path)])
@@ -1,6 +1,9 @@
+from pathlib import Path
+
 import pytest
 
-from pyrelease import load_command_module, main
+import pyrelease
+from pyrelease import COMMANDS, create_parser, get_parser, load_command_module, main
 
 
 def test_main_help_command(capsys):
@@ -52,3 +55,28 @@ def test_load_command_module_invalid():
         match="No module named 'pyrelease.commands.non_existent_command'",
     ):
         load_command_module("non_existent_command")
+
+
+def test_create_parser_all_commands():
+    """Test that create_parser registers every known command by default."""
+    _, cli_commands = create_parser()
+    assert set(cli_commands) == set(COMMANDS)
+
+
+def test_create_parser_single_command():
+    """Test that create_parser only registers the requested commands."""
+    _, cli_commands = create_parser(["tag"])
+    assert list(cli_commands) == ["tag"]
+
+
+def test_commands_match_command_modules():
+    """Test that the static command registry lists every command module."""
+    commands_path = Path(pyrelease.__file__).parent / "commands"
+    modules = {f.stem for f in commands_path.glob("*.py") if f.stem != "__init__"}
+    assert set(COMMANDS) == modules
+
+
+def test_get_parser_cached():
+    """Test that parsers are built once per set of commands."""
+    assert get_parser(("tag",)) is get_parser(("tag",))
+    assert get_parser(("tag",)) is not get_parser()
@@ -1,11 +1,19 @@
+import argparse
+import os
+
 import pytest
 
 from pyrelease.utils import (
+    GLOBAL_OPTIONS,
     CustomFormatter,
     GitRepository,
+    add_global_args,
+    clear_toml_cache,
     create_python_project,
     get_configured_args,
+    get_git_env,
     get_version_from_pyproject,
+    lookup_conventional_commit_type,
     read_pyrelease_config,
 )
 
@@ -32,9 +40,7 @@ def test_create_python_project_nonexistent_path(tmp_path_factory):
 
 def test_create_python_project_no_uv_installed(tmp_path_factory, monkeypatch):
     tmp_path = tmp_path_factory.mktemp("test-create-python-project-no-uv")
-    monkeypatch.setattr(
-        "shutil.which", lambda cmd: None if cmd == "uv" else "/usr/bin/uv"
-    )
+    monkeypatch.setattr("pyrelease.utils.get_uv_path", lambda: None)
     with pytest.raises(
         RuntimeError,
         match="The 'uv' command-line tool is required to create a Python project",
@@ -49,9 +55,8 @@ def test_create_python_project_idempotent(tmp_path_factory, monkeypatch):
         create_python_project(tmp_path, git=True)
 
 
-def test_read_pyrelease_config(tmp_path_factory):
-    tmp_path = tmp_path_factory.mktemp("test-read-pyrelease-config")
-    create_python_project(tmp_path)
+def test_read_pyrelease_config(python_project):
+    tmp_path = python_project
     config = read_pyrelease_config(tmp_path)
     required_keys = ["project-version", "project-name"]
     assert all(key in config for key in required_keys), (
@@ -75,9 +80,8 @@ def test_read_pyrelease_config_invalid_pyproject(tmp_path_factory):
         read_pyrelease_config(tmp_path)
 
 
-def test_read_pyrelease_config_with_dot_pyrelease(tmp_path_factory):
-    tmp_path = tmp_path_factory.mktemp("test-read-pyrelease-config-with-dot-pyrelease")
-    create_python_project(tmp_path)
+def test_read_pyrelease_config_with_dot_pyrelease(python_project):
+    tmp_path = python_project
     (tmp_path / ".pyrelease.toml").write_text(
         """[pyrelease]
 custom-key = "custom-value"
@@ -109,13 +113,40 @@ def test_get_configured_args():
     )
 
 
-def test_get_version_from_pyproject(tmp_path_factory):
-    tmp_path = tmp_path_factory.mktemp("test-get-version-from-pyproject")
-    create_python_project(tmp_path)
+def test_get_configured_args_does_not_mutate_config():
+    pyrelease_config = {"dry-run": True, "tag": {"message-format": "v{version}"}}
+    args = get_configured_args(pyrelease_config, "tag")
+    assert "--dry-run" in args
+    assert pyrelease_config["tag"] == {"message-format": "v{version}"}
+
+
+def test_get_version_from_pyproject(python_project):
+    tmp_path = python_project
     version = get_version_from_pyproject(tmp_path)
     assert version == "0.1.0", "Expected version 0.1.0 from pyproject.toml"
 
 
+def test_get_version_from_pyproject_cached(python_project):
+    tmp_path = python_project
+    assert get_version_from_pyproject(tmp_path) == "0.1.0"
+    pyproject_path = tmp_path / "pyproject.toml"
+    stat = pyproject_path.stat()
+    # Same size and same mtime: indistinguishable from the cached file
+    pyproject_path.write_text(
+        pyproject_path.read_text().replace('version = "0.1.0"', 'version = "0.2.0"')
+    )
+    os.utime(pyproject_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert get_version_from_pyproject(tmp_path) == "0.1.0"
+    clear_toml_cache()
+    assert get_version_from_pyproject(tmp_path) == "0.2.0"
+    # A changed mtime is picked up without clearing the cache
+    pyproject_path.write_text(
+        pyproject_path.read_text().replace('version = "0.2.0"', 'version = "0.3.0"')
+    )
+    os.utime(pyproject_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert get_version_from_pyproject(tmp_path) == "0.3.0"
+
+
 def test_get_version_from_pyproject_no_file(tmp_path_factory):
     tmp_path = tmp_path_factory.mktemp("test-get-version-from-pyproject-no-file")
     with pytest.raises(FileNotFoundError, match="pyproject.toml not found"):
@@ -158,6 +189,12 @@ def test_custom_formatter_get_keys(format_string, expected_keys):
     assert keys == expected_keys
 
 
+def test_custom_formatter_get_keys_cached():
+    format_string = "{version} - {changes} - cached"
+    keys = CustomFormatter(format_string).get_keys()
+    assert CustomFormatter().get_keys(format_string) is keys
+
+
 def test_custom_formatter_no_string():
     formatter = CustomFormatter()
     with pytest.raises(ValueError, match="No format string provided."):
@@ -214,3 +251,47 @@ def test_custom_formatter_format_no_string():
     formatter = CustomFormatter()
     with pytest.raises(ValueError, match="No format string provided."):
         formatter.format(version="1.0.0")
+
+
+@pytest.mark.parametrize(
+    "message, expected",
+    [
+        ("feat: add new feature", "feat"),
+        ("feat!: breaking change", "feat!"),
+        ("fix(parser): handle empty input", "fix"),
+        ("feat(api)!: drop old endpoint", "feat!"),
+        ("feat(api): add endpoint", "feat(api)"),
+        ("feat(ui): add button", "feat"),
+        ("docs: update readme", None),
+        ("Initial commit", None),
+        ("Merge branch 'main': sync", None),
+    ],
+)
+def test_lookup_conventional_commit_type(message, expected):
+    mapping = {
+        "feat": "feat",
+        "feat!": "feat!",
+        "fix": "fix",
+        "feat(api)": "feat(api)",
+    }
+    assert lookup_conventional_commit_type(message, mapping) == expected
+
+
+def test_global_options_match_parser():
+    parser = argparse.ArgumentParser()
+    global_args = add_global_args(parser)
+    assert [action.option_strings for action in global_args._group_actions] == [
+        [f"--{name}"] for name in GLOBAL_OPTIONS
+    ]
+    args = parser.parse_args([])
+    assert str(args.path) == "."
+    assert args.silent is False
+
+
+def test_get_git_env(monkeypatch):
+    monkeypatch.setenv("LC_ALL", "de_DE.UTF-8")
+    monkeypatch.setenv("PYRELEASE_TEST_VAR", "kept")
+    env = get_git_env()
+    assert env["LC_ALL"] == "C"
+    assert env["GIT_TERMINAL_PROMPT"] == "0"
+    assert env["PYRELEASE_TEST_VAR"] == "kept"
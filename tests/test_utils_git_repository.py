@@ -1,11 +1,14 @@
+import subprocess
+from dataclasses import fields
+
 import pytest
 
-from pyrelease.utils import GitRepository
+from pyrelease.utils import GIT_LOG_FIELDS, GitCommit, GitRepository
 
 
-def test_git_tag(tmp_path_factory):
-    tmp_path = tmp_path_factory.mktemp("test-git-tag")
-    git = GitRepository(tmp_path, init=True)
+def test_git_tag(git_repository):
+    tmp_path = git_repository
+    git = GitRepository(tmp_path)
     (tmp_path / "file.txt").write_text("Sample content")
     git.commit("Initial commit")
     git.tag("v0.1.0", "Initial tag")
@@ -16,9 +19,9 @@ def test_git_tag(tmp_path_factory):
     assert "Initial tag" == tag[1]
 
 
-def test_git_tag_no_message(tmp_path_factory):
-    tmp_path = tmp_path_factory.mktemp("test-git-tag")
-    git = GitRepository(tmp_path, init=True)
+def test_git_tag_no_message(git_repository):
+    tmp_path = git_repository
+    git = GitRepository(tmp_path)
     (tmp_path / "file.txt").write_text("Sample content")
     git.commit("Initial commit")
     git.tag("v0.1.0")
@@ -29,9 +32,9 @@ def test_git_tag_no_message(tmp_path_factory):
     assert "Tag v0.1.0" == tag[1]
 
 
-def test_git_tag_idempotent(tmp_path_factory):
-    tmp_path = tmp_path_factory.mktemp("test-git-tag-idempotent")
-    git = GitRepository(tmp_path, init=True)
+def test_git_tag_idempotent(git_repository):
+    tmp_path = git_repository
+    git = GitRepository(tmp_path)
     (tmp_path / "file.txt").write_text("Sample content")
     git.commit("Initial commit")
     git.tag("v0.1.0", "Initial tag")
@@ -47,22 +50,49 @@ def test_git_tag_idempotent(tmp_path_factory):
     assert tags == tags_after
 
 
+def test_git_tag_stale_cache(git_repository):
+    tmp_path = git_repository
+    git = GitRepository(tmp_path)
+    (tmp_path / "file.txt").write_text("Sample content")
+    git.commit("Initial commit")
+    git.tag("v0.1.0", "Initial tag")
+    assert git.get_tags() == [["v0.1.0", "Initial tag"]]
+    # Deleting the tag behind the instance's back leaves a stale listing,
+    # which must not stop the tag from being created again.
+    git._run_git_command(["tag", "-d", "v0.1.0"], check=True)
+    git.tag("v0.1.0", "Recreated tag")
+    assert git.get_tags() == [["v0.1.0", "Recreated tag"]]
+
+
+def test_get_git_tags_result_is_a_copy(git_repository):
+    tmp_path = git_repository
+    git = GitRepository(tmp_path)
+    (tmp_path / "file.txt").write_text("Sample content")
+    git.commit("Initial commit")
+    git.tag("v0.1.0", "Initial tag")
+    for latest in (False, True, False, True):
+        tags = git.get_tags(latest=latest)
+        assert tags == [["v0.1.0", "Initial tag"]]
+        tags[0][0] = "changed"
+        tags.append(["v9.9.9", "Injected"])
+
+
 def test_get_git_tags_failure(tmp_path_factory):
     tmp_path = tmp_path_factory.mktemp("test-get-git-tags-failure")
     with pytest.raises(FileNotFoundError, match="does not exist"):
         GitRepository(tmp_path / "nonexistent", init=True)
 
 
-def test_get_git_tags_empty_repo(tmp_path_factory):
-    tmp_path = tmp_path_factory.mktemp("test-get-git-tags-empty-repo")
-    git = GitRepository(tmp_path, init=True)
+def test_get_git_tags_empty_repo(git_repository):
+    tmp_path = git_repository
+    git = GitRepository(tmp_path)
     tags = git.get_tags()
     assert tags == []
 
 
-def test_get_git_tags_with_tags(tmp_path_factory):
-    tmp_path = tmp_path_factory.mktemp("test-get-git-tags-with-tags")
-    git = GitRepository(tmp_path, init=True)
+def test_get_git_tags_with_tags(git_repository):
+    tmp_path = git_repository
+    git = GitRepository(tmp_path)
     (tmp_path / "file.txt").write_text("Sample content")
     git.commit("Initial commit")
     git.tag("v0.1.0", "Initial tag")
@@ -80,9 +110,50 @@ def test_get_git_tags_with_tags(tmp_path_factory):
     assert "Initial tag" == tag2[1]
 
 
-def test_git_get_remote_url(tmp_path_factory):
-    tmp_path = tmp_path_factory.mktemp("test-git-get-remote-url")
-    git = GitRepository(tmp_path, init=True)
+def test_get_git_tags_latest(git_repository):
+    tmp_path = git_repository
+    git = GitRepository(tmp_path)
+    (tmp_path / "file.txt").write_text("Sample content")
+    git.commit("Initial commit")
+    git.tag("v0.9.0", "Old tag")
+    git.tag("v0.10.0", "New tag")
+    tags = git.get_tags(latest=True)
+    assert tags == [["v0.10.0", "New tag"]]
+
+
+def test_get_git_tags_latest_after_pre_release(git_repository):
+    tmp_path = git_repository
+    git = GitRepository(tmp_path)
+    (tmp_path / "file.txt").write_text("Sample content")
+    git.commit("Initial commit")
+    git.tag("v0.2.0rc1", "Release candidate")
+    git.tag("v0.2.0", "Final release")
+    assert git.get_tags(latest=True) == [["v0.2.0", "Final release"]]
+
+
+def test_get_git_tags_pre_release_order(git_repository):
+    tmp_path = git_repository
+    git = GitRepository(tmp_path)
+    (tmp_path / "file.txt").write_text("Sample content")
+    git.commit("Initial commit")
+    expected = [
+        "v0.2.0.post1",
+        "v0.2.0",
+        "v0.2.0rc1",
+        "v0.2.0b1",
+        "v0.2.0a1",
+        "v0.2.0.dev1",
+        "v0.2.0-rc.1",
+        "v0.1.0",
+    ]
+    for tag in sorted(expected):
+        git.tag(tag)
+    assert [tag for tag, _ in git.get_tags()] == expected
+
+
+def test_git_get_remote_url(git_repository):
+    tmp_path = git_repository
+    git = GitRepository(tmp_path)
     (tmp_path / "file.txt").write_text("Sample content")
     git.commit("Initial commit")
     remote_url = git.get_remote_url()
@@ -97,20 +168,126 @@ def test_git_get_remote_url(tmp_path_factory):
         ["http://example.com/repo.git", "https://example.com/repo"],
     ],
 )
-def test_git_get_remote_url_with_remote(remote, expected, tmp_path_factory):
-    tmp_path = tmp_path_factory.mktemp("test-git-get-remote-url-with-remote")
-    git = GitRepository(tmp_path, init=True)
+def test_git_get_remote_url_with_remote(remote, expected, git_repository):
+    tmp_path = git_repository
+    git = GitRepository(tmp_path)
     git._run_git_command(["remote", "add", "origin", remote])
     remote_url = git.get_remote_url()
     assert remote_url == expected
 
 
-def test_git_get_remote_url_invalid_format(tmp_path_factory):
-    tmp_path = tmp_path_factory.mktemp("test-git-get-remote-url-invalid-format")
-    git = GitRepository(tmp_path, init=True)
+def test_git_get_remote_url_invalid_format(git_repository):
+    tmp_path = git_repository
+    git = GitRepository(tmp_path)
     git._run_git_command(["remote", "add", "origin", "ftp://example.com/repo.git"])
     with pytest.raises(
         ValueError,
         match="Unsupported remote URL format: 'ftp://example.com/repo.git'.",
     ):
         git.get_remote_url()
+
+
+def test_get_commits_since_special_characters(git_repository):
+    tmp_path = git_repository
+    git = GitRepository(tmp_path)
+    (tmp_path / "file.txt").write_text("Sample content")
+    message = 'fix: handle "quoted" {braces} and \\backslashes'
+    commit_hash = git.commit(message)
+    with pytest.warns(UserWarning, match="Failed to get remote URL"):
+        commits = git.get_commits_since()
+    assert len(commits) == 1
+    assert commits[0].message == message
+    assert commits[0].abbr_hash == commit_hash
+    assert commits[0].remote_url == ""
+
+
+def test_git_get_remote_url_is_cached(git_repository):
+    tmp_path = git_repository
+    git = GitRepository(tmp_path)
+    git._run_git_command(["remote", "add", "origin", "https://example.com/a.git"])
+    assert git.get_remote_url() == "https://example.com/a"
+    git._run_git_command(["remote", "set-url", "origin", "https://example.com/b"])
+    assert git.get_remote_url() == "https://example.com/a"
+
+
+def test_iter_commits_since_close_early(git_repository):
+    tmp_path = git_repository
+    git = GitRepository(tmp_path)
+    for i in range(3):
+        (tmp_path / f"file{i}.txt").write_text(f"Content {i}")
+        git.commit(f"Commit {i}")
+    with pytest.warns(UserWarning, match="Failed to get remote URL"):
+        commits = git.iter_commits_since()
+        first = next(commits)
+    commits.close()
+    assert first.message == "Commit 2"
+
+
+def test_iter_commits_since_unknown_ref(git_repository):
+    tmp_path = git_repository
+    git = GitRepository(tmp_path)
+    (tmp_path / "file.txt").write_text("Sample content")
+    git.commit("Initial commit")
+    with pytest.raises(RuntimeError, match="'v9.9.9..HEAD': fatal: .*v9.9.9"):
+        list(git.iter_commits_since(from_ref="v9.9.9"))
+
+
+def test_get_commits_since_non_ascii(git_repository):
+    tmp_path = git_repository
+    git = GitRepository(tmp_path)
+    (tmp_path / "file.txt").write_text("Sample content")
+    git.commit("feat: support ünïcödé ✓")
+    with pytest.warns(UserWarning, match="Failed to get remote URL"):
+        commits = git.get_commits_since()
+    assert commits[0].message == "feat: support ünïcödé ✓"
+
+
+def test_git_repo_after_init(tmp_path_factory):
+    tmp_path = tmp_path_factory.mktemp("test-git-repo-after-init")
+    git = GitRepository(tmp_path)
+    assert not git._is_git_repo()
+    git.init()
+    assert git._is_git_repo()
+
+
+def test_git_repo_bare(tmp_path_factory):
+    tmp_path = tmp_path_factory.mktemp("test-git-repo-bare")
+    bare_path = tmp_path / "x.git"
+    subprocess.run(["git", "init", "-q", "--bare", str(bare_path)], check=True)
+    git = GitRepository(bare_path, init=True)
+    assert git._is_git_repo()
+    assert not (bare_path / ".git").exists()
+    assert GitRepository(tmp_path / "x.git" / "refs")._is_git_repo()
+
+
+def test_git_repo_subdirectory(tmp_path_factory):
+    tmp_path = tmp_path_factory.mktemp("test-git-repo-subdirectory")
+    GitRepository(tmp_path, init=True)
+    subdir = tmp_path / "subdir"
+    subdir.mkdir()
+    assert GitRepository(subdir)._is_git_repo()
+
+
+def test_get_git_tags_cached_until_tag(git_repository):
+    tmp_path = git_repository
+    git = GitRepository(tmp_path)
+    (tmp_path / "file.txt").write_text("Sample content")
+    git.commit("Initial commit")
+    git.tag("v0.1.0", "Initial tag")
+    assert git.get_tags() == [["v0.1.0", "Initial tag"]]
+    # Tags created behind the instance's back are not seen until it tags itself
+    git._run_git_command(["tag", "-a", "v0.2.0", "-m", "Outside tag"])
+    assert git.get_tags(latest=True) == [["v0.1.0", "Initial tag"]]
+    git.tag("v0.3.0", "Third tag")
+    assert [tag for tag, _ in git.get_tags()] == ["v0.3.0", "v0.2.0", "v0.1.0"]
+
+
+def test_git_log_fields_match_git_commit():
+    field_names = [field.name for field in fields(GitCommit)]
+    assert field_names == ["remote_url", *GIT_LOG_FIELDS]
+
+
+def test_git_commit_uses_slots():
+    commit = GitCommit("url", "abc1234")
+    assert not hasattr(commit, "__dict__")
+    assert commit.abbr_hash == "abc1234"